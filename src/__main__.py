@@ -0,0 +1,38 @@
+import sys
+
+from src.error import BaseError, InterpreterError
+from src.interpreter.executor import execute
+from src.lexer import tokenize
+from src.parser import Parser
+
+# የተከፋፈሉት የ dispatch ተቆጣጣሪዎች በየተጠቃሚ ጥሪ ~9 የፓይተን frame
+# ይፈጃሉ (የድሮው ዛፍ ~4 ነበር)፤ ገደቡ በተመጣጣኝ ይነሳል — የተጠቃሚ
+# ፕሮግራም የመደጋገም ጥልቀት እንዳይቀንስ
+sys.setrecursionlimit(5000)
+
+
+def run_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    tokens = tokenize(source, filename=path)
+    statements = Parser(tokens, filename=path).parse()
+    try:
+        for statement in statements:
+            execute(statement)
+    except RecursionError:
+        raise InterpreterError("የመደጋገም ጥልቀት ገደብ አለፈ")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("አጠቃቀም: python -m src <ፋይል.abis>")
+        sys.exit(1)
+    try:
+        run_file(sys.argv[1])
+    except BaseError as err:
+        print(err, file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
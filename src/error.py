@@ -0,0 +1,194 @@
+import sys
+
+# የቶከን አይነቶች እንዴት እንደሚተረጎሙ ይወስናል ('am' ወይም 'en')
+LOCALE = 'am'
+
+
+class LazyStr:
+    """__str__ እስኪጠራ ድረስ የመልዕክት ግንባታን ያዘገያል።
+
+    ስህተቶች ተነስተው ሳይታዩ ሲያዙ (ለምሳሌ በሙከራ ትንተና ወቅት) የ f-string
+    ወጪው በጭራሽ አይከፈልም።
+    """
+
+    __slots__ = ('fn',)
+
+    def __init__(self, fn):
+        self.fn = fn
+
+    def __str__(self):
+        return self.fn()
+
+
+class BaseError(Exception):
+    """የሁሉም የቋንቋው ስህተቶች መሠረት።
+
+    message እንደ str ወይም LazyStr ሊሰጥ ይችላል፤ ወደ ጽሑፍ የሚቀየረው
+    format_error ሲጠራ ብቻ ነው።
+    """
+
+    __slots__ = ('message', 'token', 'pos', 'line', 'col', 'filename',
+                 'hint', '_formatted')
+
+    def __init__(self, message, token=None, pos=None, line=None, col=None,
+                 filename=None, hint=None):
+        super().__init__(message)
+        self.message = message
+        self.token = token
+        self.pos = pos
+        self.line = line
+        self.col = col
+        self.filename = filename
+        self.hint = hint
+        self._formatted = None
+
+    def __str__(self):
+        if self._formatted is None:
+            self._formatted = format_error(self)
+        return self._formatted
+
+
+class LexerError(BaseError):
+    __slots__ = ()
+
+
+class ParseError(BaseError):
+    __slots__ = ()
+
+
+class InterpreterError(BaseError):
+    __slots__ = ()
+
+
+_TRANSLATIONS = {
+    sys.intern(key): value for key, value in {
+    'IDENTIFIER': 'መለያ ስም',
+    'NUMBER': 'ቁጥር',
+    'STRING': 'ጽሑፍ',
+    'FUNCTION': 'ተግባር',
+    'LPAREN': "'('",
+    'RPAREN': "')'",
+    'LBRACE': "'{'",
+    'RBRACE': "'}'",
+    'SEMICOLON': "'።'",
+    'COMMA': "'፣'",
+    }.items()
+}
+
+
+def translate_token_type(token_type, locale=LOCALE):
+    """የቶከን አይነት ስም እንደ locale ወደ መግለጫ ይቀይራል።"""
+    # አብዛኞቹ አይነቶች ከታወቁ ጽሑፎች ስለሆኑ EAFP ፈጣኑ መንገድ ነው
+    if locale == 'am':
+        try:
+            return _TRANSLATIONS[token_type]
+        except KeyError:
+            pass
+    if isinstance(token_type, str):
+        return token_type
+    return str(token_type) if token_type is not None else "<ምንም>"
+
+
+def format_error(err):
+    """ስህተቱን ለማሳየት ወደ አንድ መስመር ጽሑፍ ይቀይራል።"""
+    # ቶከኑ በቀጥታ ይፈታል — መካከለኛ dict መገንባት አያስፈልግም
+    token = err.token
+    if token is None:
+        ttype = value = t_line = t_col = None
+    elif isinstance(token, tuple):
+        n = len(token)
+        if n == 2:
+            ttype, value = token
+            t_line = t_col = None
+        elif n >= 4:
+            ttype, value, t_line, t_col = \
+                token[0], token[1], token[2], token[3]
+        else:
+            ttype = value = t_line = t_col = None
+    else:
+        ttype = t_line = t_col = None
+        value = token
+    # BaseError.__init__ ሁልጊዜ line/col ይመድባል — getattr ጥበቃ አያስፈልግም
+    line = err.line if err.line is not None else t_line
+    col = err.col if err.col is not None else t_col
+    loc_parts = []
+    if err.filename:
+        loc_parts.append(err.filename)
+    if line is not None:
+        loc_parts.append(f":{line}")
+    if col is not None:
+        loc_parts.append(f":{col}")
+    loc = "".join(loc_parts)
+    token_parts = []
+    if ttype is not None:
+        token_parts.append(translate_token_type(ttype))
+    if value is not None:
+        token_parts.append(f" '{value}'")
+    token_info = "".join(token_parts)
+    parts = [err.__class__.__name__]
+    if loc:
+        parts.append(loc)
+    parts.append(str(err.message))
+    if token_info:
+        parts.append(token_info)
+    if err.hint:
+        parts.append(err.hint)
+    return " — ".join(parts)
+
+
+def unexpected_token(parser_or_token, expected=None, found=None):
+    """ላልተጠበቀ ቶከን ParseError ይገነባል።"""
+    if hasattr(parser_or_token, "error_location"):
+        # ፓርሰሮች ቦታውን በአንድ ጥሪ ይሰጣሉ — የ getattr ሰንሰለቱ አያስፈልግም
+        line, col, filename = parser_or_token.error_location()
+        tokens = parser_or_token.tokens
+        pos = parser_or_token.pos
+    else:
+        tokens = getattr(parser_or_token, "tokens", None)
+        pos = getattr(parser_or_token, "pos", None)
+        line = getattr(parser_or_token, "line", None)
+        col = getattr(parser_or_token, "col", None)
+        filename = getattr(parser_or_token, "filename", None)
+    token = found
+    if token is None and tokens is not None and pos is not None \
+            and pos < len(tokens):
+        token = tokens[pos]
+    message = "ያልተጠበቀ ምልክት"
+    if expected is not None:
+        message += f" — የተጠበቀው {translate_token_type(expected)}"
+    return ParseError(message, token=token, pos=pos, line=line, col=col,
+                      filename=filename)
+
+
+class AggregateParseError(ParseError):
+    """በርካታ የትንተና ስህተቶችን ይዞ ሲታይ ብቻ ይቀርጻቸዋል።"""
+
+    __slots__ = ('errors',)
+
+    def __init__(self, errors):
+        super().__init__("Multiple errors")
+        self.errors = errors
+
+    def __str__(self):
+        if self._formatted is None:
+            lines = ["Multiple errors:"]
+            for err in self.errors:
+                lines.append(format_error(err))
+            self._formatted = "\n".join(lines)
+        return self._formatted
+
+
+class Reporter:
+    """ስህተቶችን ሰብስቦ በአንድ ላይ ያነሳል።"""
+
+    def __init__(self):
+        self._errors = []
+
+    def add(self, err):
+        self._errors.append(err)
+
+    def raise_if_any(self):
+        if not self._errors:
+            return
+        # ቅርጸቱ የሚሰራው ስህተቱ በትክክል ሲታይ ብቻ ነው
+        raise AggregateParseError(list(self._errors))
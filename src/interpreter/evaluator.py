@@ -0,0 +1,308 @@
+import operator
+from collections import ChainMap
+
+from src.error import InterpreterError, LazyStr
+from src.nodes import (Assign, BinOp, Boolean, Class, ClassCall, FunctionCall,
+                       Functions, Input, ListAccessPos, ListNode,
+                       ModuleAccess, Number, String, Variable)
+from src.runtime.builtins import BuiltinFunction, builtins
+from src.runtime.environment import env
+
+
+def call_function(func, args):
+    """የተጠቃሚ ተግባርን በራሱ ወሰን ውስጥ ይፈጽማል።"""
+    from src.interpreter.executor import ReturnValue, cached_body
+    arity = func._arity
+    if len(args) != arity:
+        raise InterpreterError(
+            f"'{func.name}' የመከራከሪያ ብዛት ስህተት: የተጠበቀው "
+            f"{arity}፣ የተገኘው {len(args)}")
+    # ለተለመዱት ትንንሽ arity ዎች ያለ zip/ዑደት በቀጥታ ይገነባል
+    params = func.params
+    if arity == 0:
+        local = {}
+    elif arity == 1:
+        local = {params[0]: args[0]}
+    elif arity == 2:
+        local = {params[0]: args[0], params[1]: args[1]}
+    else:
+        local = {}
+        for i in range(arity):
+            local[params[i]] = args[i]
+    # ሙሉ ቅጂ ከመስራት ይልቅ መለኪያዎቹ ብቻ በአዲስ ወሰን ይደረደራሉ፤
+    # ጽሁፎች ወደ መጀመሪያው dict ስለሚሄዱ እንደ ቅጂው ይጣላሉ
+    old_memory = env.memory
+    env.memory = ChainMap(local, old_memory)
+    env.memory_version += 1
+    result = None
+    try:
+        for handler, statement in cached_body(func):
+            handler(statement)
+    except ReturnValue as ret:
+        result = ret.value
+    finally:
+        env.memory = old_memory
+        env.memory_version += 1
+    return result
+
+
+def _eval_number(node):
+    return node.value
+
+
+def _eval_string(node):
+    return node.value
+
+
+def _eval_boolean(node):
+    return node.value
+
+
+def _eval_list(node):
+    return [evaluate(element) for element in node.elements]
+
+
+def _eval_variable(node):
+    # inline cache: ማህደረ ትውስታው ካልተለወጠ ያለ dict ፍለጋ ይመልሳል።
+    # የውስጥ-ተግባር ስሞችም በአሁኑ ስሪት ይሸጎጣሉ — ቋሚ መሸጎጫ አይደለም፤
+    # Assign ማንኛውንም ስም ሊጋርድ ስለሚችል ከጽሁፍ በኋላ እንደገና ይፈለጋሉ
+    version = env.memory_version
+    if node._cache_version == version:
+        return node._cache_value
+    # env.memory በየጥሪው ስለሚቀየር እዚህ እንጂ በሞጁል ደረጃ አይያዝም
+    mem = env.memory
+    name = node.name
+    if name in mem:
+        value = mem[name]
+    elif name in builtins:
+        value = builtins[name]
+    else:
+        raise InterpreterError(
+            LazyStr(lambda n=name: f"ያልታወቀ መለያ ስም -> '{n}'"))
+    node._cache_version = version
+    node._cache_value = value
+    return value
+
+
+_BINOPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+
+# የፖስትፊክስ ኮድ ኦፕኮዶች
+_LOAD_CONST = 0
+_LOAD_VAR = 1
+_BINOP = 2
+
+
+def compile_expr(node):
+    """የሂሳብ BinOp ዛፍን ወደ ጠፍጣፋ ፖስትፊክስ ኮድ ይቀይራል።
+
+    ሊታመቅ የማይችል ከሆነ (ለምሳሌ && / || ወይም ጥሪ ሲይዝ) None ይመልሳል።
+    """
+    code = []
+    if _compile_into(node, code):
+        return code
+    return None
+
+
+def _compile_into(node, code):
+    ntype = type(node)
+    if ntype is Number or ntype is String or ntype is Boolean:
+        code.append((_LOAD_CONST, node.value))
+        return True
+    if ntype is Variable:
+        code.append((_LOAD_VAR, node.name))
+        return True
+    if ntype is BinOp:
+        fn = _BINOPS.get(node.op)
+        if fn is None:
+            return False
+        if not _compile_into(node.left, code):
+            return False
+        if not _compile_into(node.right, code):
+            return False
+        code.append((_BINOP, fn))
+        return True
+    return False
+
+
+def run_expr(code, memory):
+    """የታመቀ ፖስትፊክስ ኮድን በቁልል ማሽን ይፈጽማል።"""
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    for op, arg in code:
+        if op == _LOAD_CONST:
+            push(arg)
+        elif op == _LOAD_VAR:
+            if arg in memory:
+                push(memory[arg])
+            elif arg in builtins:
+                push(builtins[arg])
+            else:
+                raise InterpreterError(
+                    LazyStr(lambda n=arg: f"ያልታወቀ መለያ ስም -> '{n}'"))
+        else:
+            right = pop()
+            push(arg(pop(), right))
+    return stack[0]
+
+
+def _eval_binop(node):
+    code = node._code
+    if code is None:
+        code = compile_expr(node)
+        if code is None:
+            code = False
+        node._code = code
+    if code is not False:
+        return run_expr(code, env.memory)
+    op = node.op
+    # && እና || አጭር-ዙር ናቸው — ቀኙ ጎን የሚገመገመው ሲያስፈልግ ብቻ ነው
+    if op == '&&':
+        left = evaluate(node.left)
+        return left and evaluate(node.right)
+    if op == '||':
+        left = evaluate(node.left)
+        return left or evaluate(node.right)
+    left = evaluate(node.left)
+    right = evaluate(node.right)
+    fn = _BINOPS.get(op)
+    if fn is None:
+        raise InterpreterError(f"ያልታወቀ ኦፕሬተር -> '{op}'")
+    return fn(left, right)
+
+
+def _lookup_name(name):
+    """ስምን በማህደረ ትውስታ ከዚያም በውስጥ ተግባራት ውስጥ ይፈልጋል።"""
+    mem = env.memory
+    if name in mem:
+        return mem[name]
+    if name in builtins:
+        return builtins[name]
+    raise InterpreterError(
+        LazyStr(lambda n=name: f"ያልታወቀ መለያ ስም -> '{n}'"))
+
+
+def _eval_list_access(node):
+    values = _lookup_name(node.name)
+    index = evaluate(node.index)
+    if not isinstance(values, list):
+        raise InterpreterError(f"'{node.name}' ዝርዝር አይደለም")
+    if index < 0 or index >= len(values):
+        raise InterpreterError(
+            f"የዝርዝር ወሰን ስህተት -> '{node.name}[{index}]'")
+    return values[index]
+
+
+def _eval_input(node):
+    return input(evaluate(node.prompt))
+
+
+def _eval_function_call(node):
+    func = _lookup_name(node.name)
+    args = [evaluate(arg) for arg in node.args]
+    if isinstance(func, BuiltinFunction):
+        # safe የውስጥ ተግባራት ያለ call መጠቅለያው በቀጥታ ይጠራሉ፤
+        # ስህተት ከተነሳ ወደ call ተመልሶ InterpreterError ሆኖ ይቀርባል
+        if func.safe and len(args) == func.arity:
+            try:
+                return func.fn(*args)
+            except Exception:
+                pass
+        return func.call(args)
+    if isinstance(func, Functions):
+        compiled = func._compiled
+        if compiled is not None:
+            try:
+                return compiled.fn(*args)
+            except Exception:
+                # የ Numba ድንበር ማለፍ/ታይፒንግ ስህተት — ወደ አስተርጓሚው ይመለሳል
+                func._compiled = None
+        return call_function(func, args)
+    raise InterpreterError(f"'{node.name}' ተግባር አይደለም")
+
+
+def _eval_class_call(node):
+    cls = _lookup_name(node.name)
+    if not isinstance(cls, Class):
+        raise InterpreterError(f"'{node.name}' ክፍል አይደለም")
+    instance = {}
+    for statement in cls.body:
+        if isinstance(statement, Assign):
+            instance[statement.name] = evaluate(statement.value)
+        elif isinstance(statement, Functions):
+            instance[statement.name] = statement
+    return instance
+
+
+# አንድ የጋራ እይታ በሦስቱ የስም ቦታዎች ላይ — ChainMap እይታ ስለሆነ
+# በ env.modules / env.classes ላይ የሚደረጉ ምዝገባዎች ወዲያውኑ ይታያሉ
+_NAMESPACES = ChainMap(builtins, env.modules, env.classes)
+
+
+def _eval_module_access(node):
+    ns = _NAMESPACES.get(node.module_name)
+    if ns is None:
+        raise InterpreterError(f"ያልታወቀ ሞጁል -> '{node.module_name}'")
+    if isinstance(ns, Class):
+        method = ns.methods.get(node.name)
+        if method is None:
+            raise InterpreterError(
+                f"'{node.module_name}' ውስጥ '{node.name}' አልተገኘም")
+        if node.args is None:
+            return method
+        args = [evaluate(arg) for arg in node.args]
+        return call_function(method, args)
+    if not isinstance(ns, dict):
+        raise InterpreterError(f"'{node.module_name}' ሞጁል አይደለም")
+    if node.name not in ns:
+        raise InterpreterError(
+            f"'{node.module_name}' ውስጥ '{node.name}' አልተገኘም")
+    member = ns[node.name]
+    if node.args is None:
+        return member
+    args = [evaluate(arg) for arg in node.args]
+    if isinstance(member, BuiltinFunction):
+        if member.safe and len(args) == member.arity:
+            try:
+                return member.fn(*args)
+            except Exception:
+                pass
+        return member.call(args)
+    if isinstance(member, Functions):
+        return call_function(member, args)
+    raise InterpreterError(f"'{node.name}' ተግባር አይደለም")
+
+
+_DISPATCH = {
+    Number: _eval_number,
+    String: _eval_string,
+    Boolean: _eval_boolean,
+    ListNode: _eval_list,
+    Variable: _eval_variable,
+    BinOp: _eval_binop,
+    ListAccessPos: _eval_list_access,
+    Input: _eval_input,
+    FunctionCall: _eval_function_call,
+    ClassCall: _eval_class_call,
+    ModuleAccess: _eval_module_access,
+}
+
+
+def evaluate(node):
+    """የአገላለጽ ቅንጣትን ገምግሞ እሴቱን ይመልሳል።"""
+    handler = _DISPATCH.get(type(node))
+    if handler is not None:
+        return handler(node)
+    raise InterpreterError(f"ያልታወቀ አገላለጽ -> {node!r}")
@@ -0,0 +1,184 @@
+import os
+
+from src.error import InterpreterError
+from src.interpreter.evaluator import call_function, evaluate
+from src.interpreter.jit import try_compile
+from src.lexer import tokenize
+from src.nodes import (Assign, BinOp, Class, ForLoop, FunctionCall,
+                       Functions, IfStatement, ImportStatement, ListAccessPos,
+                       ListAssign, ModuleAccess, Number, Print, Return,
+                       String, Variable, WhileLoop)
+from src.parser import Parser
+from src.runtime.environment import env
+
+
+class ReturnValue(Exception):
+    """ከተግባር አካል የመልስ እሴትን ወደ ጠሪው ያስተላልፋል።"""
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.value = value
+
+
+def _exec_assign(stmt):
+    env.memory[stmt.name] = evaluate(stmt.value)
+    env.memory_version += 1
+
+
+def _exec_list_assign(stmt):
+    values = env.memory.get(stmt.name)
+    if not isinstance(values, list):
+        raise InterpreterError(f"'{stmt.name}' ዝርዝር አይደለም")
+    index = evaluate(stmt.index)
+    if index < 0 or index >= len(values):
+        raise InterpreterError(
+            f"የዝርዝር ወሰን ስህተት -> '{stmt.name}[{index}]'")
+    values[index] = evaluate(stmt.value)
+
+
+def _exec_print(stmt):
+    print(evaluate(stmt.value))
+
+
+def _exec_if(stmt):
+    for condition, body in stmt.branches:
+        if evaluate(condition):
+            for s in body:
+                execute(s)
+            return
+    if stmt.else_body is not None:
+        for s in stmt.else_body:
+            execute(s)
+
+
+def cached_body(stmt):
+    """የመግለጫ አካልን ወደ (handler, stmt) ጥንዶች አንዴ ይቀይራል።"""
+    body = stmt._cached_body
+    if body is None:
+        body = stmt._cached_body = tuple(
+            (_DISPATCH[type(s)], s) for s in stmt.body)
+    return body
+
+
+def _exec_while(stmt):
+    body = cached_body(stmt)
+    condition = stmt.condition
+    # evaluate እንደ ሎካል ይታሰራል — በየዙሩ የሞጁል-ደረጃ ፍለጋ አይከፈልም
+    ev = evaluate
+    while ev(condition):
+        for handler, s in body:
+            handler(s)
+
+
+def _exec_for(stmt):
+    start = evaluate(stmt.start)
+    end = evaluate(stmt.end)
+    body = cached_body(stmt)
+    var = stmt.var
+    mem = env.memory
+    for i in range(start, end):
+        mem[var] = i
+        env.memory_version += 1
+        for handler, s in body:
+            handler(s)
+
+
+def _exec_function_def(stmt):
+    if stmt._compiled is None:
+        stmt._compiled = try_compile(stmt)
+    env.functions[stmt.name] = stmt
+    env.memory[stmt.name] = stmt
+    env.memory_version += 1
+
+
+def _exec_class_def(stmt):
+    env.classes[stmt.name] = stmt
+    env.memory[stmt.name] = stmt
+    env.memory_version += 1
+
+
+def _exec_return(stmt):
+    raise ReturnValue(evaluate(stmt.value))
+
+
+# የተፈቱ ሞጁሎች መሸጎጫ — ቁልፉ (ፍጹም ዱካ, mtime_ns)፣ እሴቱ የተጠናቀቀ
+# module_content ነው፤ የሞጁል-ደረጃ ቋሚዎች በአንድ የፋይል ስሪት አንዴ ብቻ ይገመገማሉ
+_IMPORT_CACHE = {}
+
+
+def _exec_import(stmt):
+    path = stmt.path
+    if not os.path.exists(path):
+        raise InterpreterError(f"ፋይል አልተገኘም -> '{path}'")
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    module_content = _IMPORT_CACHE.get(key)
+    if module_content is None:
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+        tokens = tokenize(source, filename=path)
+        module_ast = Parser(tokens, filename=path).parse()
+        module_content = {}
+        for node in module_ast:
+            if isinstance(node, Functions):
+                module_content[node.name] = node
+            elif isinstance(node, Assign):
+                module_content[node.name] = evaluate(node.value)
+        _IMPORT_CACHE[key] = module_content
+    if stmt.alias:
+        module_name = stmt.alias
+    else:
+        module_name = os.path.splitext(os.path.basename(path))[0]
+    env.modules[module_name] = module_content
+    for name, node in module_content.items():
+        if isinstance(node, Functions):
+            env.global_funcs[name] = node
+
+
+def _exec_function_call(stmt):
+    # call_function የመለኪያዎቹን ወሰን ብቻ ይደረድራል — ሙሉ የማህደረ
+    # ትውስታ ቅጂ የለም
+    func = env.functions.get(stmt.name) or env.global_funcs.get(stmt.name)
+    if func is not None:
+        arg_values = [evaluate(arg) for arg in stmt.args]
+        call_function(func, arg_values)
+        return
+    evaluate(stmt)
+
+
+def _exec_expression(stmt):
+    evaluate(stmt)
+
+
+def _exec_literal(stmt):
+    # ብቻውን የቆመ ቋሚ (ለምሳሌ `5።`) ምንም ውጤት የለውም — ግምገማው ይዘለላል።
+    # Variable ግን ይገመገማል፤ ያልታወቀ ስም ስህተት ማንሳት አለበት።
+    pass
+
+
+_DISPATCH = {
+    Assign: _exec_assign,
+    ListAssign: _exec_list_assign,
+    Print: _exec_print,
+    IfStatement: _exec_if,
+    WhileLoop: _exec_while,
+    ForLoop: _exec_for,
+    Functions: _exec_function_def,
+    Class: _exec_class_def,
+    Return: _exec_return,
+    ImportStatement: _exec_import,
+    FunctionCall: _exec_function_call,
+    ModuleAccess: _exec_expression,
+    ListAccessPos: _exec_expression,
+    BinOp: _exec_expression,
+    Variable: _exec_expression,
+    Number: _exec_literal,
+    String: _exec_literal,
+}
+
+
+def execute(stmt):
+    """አንድ መግለጫ ይፈጽማል።"""
+    handler = _DISPATCH.get(type(stmt))
+    if handler is not None:
+        return handler(stmt)
+    raise Exception(f"ያልታወቀ መግለጫ -> {stmt!r}")
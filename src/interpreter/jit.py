@@ -0,0 +1,138 @@
+"""ሙሉ በሙሉ ቁጥራዊ የሆኑ የተጠቃሚ ተግባራትን በ Numba ወደ ማሽን ኮድ ይቀይራል።
+
+Numba ካልተጫነ ወይም ተግባሩ የማይደገፉ ቅንጣቶች ካሉት try_compile None
+ይመልሳል እና አስተርጓሚው እንደተለመደው በዛፍ-መራመድ ይቀጥላል።
+"""
+
+import keyword
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from src.nodes import (Assign, BinOp, Boolean, ForLoop, IfStatement, Number,
+                       Print, Return, Variable, WhileLoop)
+
+_BINOP_SRC = {
+    '+': '+', '-': '-', '*': '*', '/': '/',
+    '>': '>', '<': '<', '>=': '>=', '<=': '<=',
+    '==': '==', '!=': '!=', '&&': 'and', '||': 'or',
+}
+
+
+class _Unsupported(Exception):
+    """ተግባሩ ወደ Numba ሊቀየር አይችልም።"""
+
+
+class CompiledFunction:
+    """የታመቀ ተግባር ከ AST ጎን የሚቀመጥ መጠቅለያ።"""
+
+    __slots__ = ('name', 'fn', 'arity')
+
+    def __init__(self, name, fn, arity):
+        self.name = name
+        self.fn = fn
+        self.arity = arity
+
+
+def _collect_bound(body, bound):
+    for stmt in body:
+        t = type(stmt)
+        if t is Assign:
+            bound.add(stmt.name)
+        elif t is IfStatement:
+            for _, branch_body in stmt.branches:
+                _collect_bound(branch_body, bound)
+            if stmt.else_body is not None:
+                _collect_bound(stmt.else_body, bound)
+        elif t is WhileLoop:
+            _collect_bound(stmt.body, bound)
+        elif t is ForLoop:
+            bound.add(stmt.var)
+            _collect_bound(stmt.body, bound)
+
+
+def _expr_src(node, bound):
+    t = type(node)
+    if t is Number:
+        return repr(node.value)
+    if t is Boolean:
+        return 'True' if node.value else 'False'
+    if t is Variable:
+        # ያልታሰሩ ስሞች (globals) ትርጉማቸው በአስተርጓሚው ወሰን ውስጥ ነው
+        if node.name not in bound:
+            raise _Unsupported
+        return node.name
+    if t is BinOp:
+        op = _BINOP_SRC.get(node.op)
+        if op is None:
+            raise _Unsupported
+        return (f"({_expr_src(node.left, bound)} {op} "
+                f"{_expr_src(node.right, bound)})")
+    raise _Unsupported
+
+
+def _stmt_src(stmt, lines, indent, bound):
+    pad = '    ' * indent
+    t = type(stmt)
+    if t is Assign:
+        lines.append(f"{pad}{stmt.name} = {_expr_src(stmt.value, bound)}")
+    elif t is Return:
+        lines.append(f"{pad}return {_expr_src(stmt.value, bound)}")
+    elif t is Print:
+        lines.append(f"{pad}print({_expr_src(stmt.value, bound)})")
+    elif t is IfStatement:
+        keyword = 'if'
+        for condition, body in stmt.branches:
+            lines.append(f"{pad}{keyword} {_expr_src(condition, bound)}:")
+            _block_src(body, lines, indent + 1, bound)
+            keyword = 'elif'
+        if stmt.else_body is not None:
+            lines.append(f"{pad}else:")
+            _block_src(stmt.else_body, lines, indent + 1, bound)
+    elif t is WhileLoop:
+        lines.append(f"{pad}while {_expr_src(stmt.condition, bound)}:")
+        _block_src(stmt.body, lines, indent + 1, bound)
+    elif t is ForLoop:
+        lines.append(f"{pad}for {stmt.var} in "
+                     f"range({_expr_src(stmt.start, bound)}, "
+                     f"{_expr_src(stmt.end, bound)}):")
+        _block_src(stmt.body, lines, indent + 1, bound)
+    else:
+        raise _Unsupported
+
+
+def _block_src(body, lines, indent, bound):
+    if not body:
+        lines.append('    ' * indent + 'pass')
+        return
+    for stmt in body:
+        _stmt_src(stmt, lines, indent, bound)
+
+
+def try_compile(func):
+    """Functions ቅንጣትን ወደ njit ተግባር ለመቀየር ይሞክራል።
+
+    ሲሳካ CompiledFunction፣ ካልተቻለ None ይመልሳል።
+    """
+    if njit is None or not func.body:
+        return None
+    bound = set(func.params)
+    _collect_bound(func.body, bound)
+    # የቋንቋው ቁልፍ ቃላት አማርኛ ስለሆኑ 'if'፣ 'class'፣ 'True' ወዘተ ተራ
+    # መለያ ስሞች ናቸው — ወደ ፓይተን ምንጭ ሲገቡ SyntaxError ያስከትላሉ
+    for name in (func.name, *bound):
+        if keyword.iskeyword(name):
+            return None
+    lines = [f"def {func.name}({', '.join(func.params)}):"]
+    try:
+        _block_src(func.body, lines, 1, bound)
+    except _Unsupported:
+        return None
+    namespace = {}
+    # ምንጩ ከ AST ብቻ የተመነጨ ነው — የተጠቃሚ ጽሑፍ አይካተትም።
+    # cache=True የእውነተኛ ፋይል ምንጭ ስለሚጠይቅ እዚህ አይውልም።
+    exec("\n".join(lines), namespace)
+    return CompiledFunction(func.name, njit(namespace[func.name]),
+                            func._arity)
@@ -0,0 +1,158 @@
+import re
+import sys
+
+from src.error import LexerError
+
+# ባለ አንድ ፊደል ለውጦች በአንድ የ translate ዙር ይሰራሉ — እያንዳንዱ
+# str.replace ሙሉ O(n) ቅኝት ስለሆነ መቀጣጠላቸው ውድ ነው
+_TRANS = str.maketrans({
+    '።': ';',
+    '፣': ',',
+    '፡': '.',
+    '­': None,
+    '“': '"',
+    '”': '"',
+    '‘': "'",
+    '’': "'",
+    '‹': '<',
+    '›': '>',
+})
+
+
+def normalize_code(code):
+    """የአማርኛ ሥርዓተ ነጥብ ወደ መደበኛ ምልክቶች ይቀይራል።"""
+    code = code.translate(_TRANS)
+    # ባለ ብዙ ፊደል ቃላት በ translate አይቻሉም — replace ይቆያሉ
+    code = code.replace('እና', '&&')
+    code = code.replace('ወይም', '||')
+    return code
+
+
+TOKEN_REGEX = [
+    (r'~~.*?~~', 'COMMENT'),
+    (r'አስመጣ\b', 'IMPORT'),
+    (r'እንደ\b', 'AS'),
+    (r'ከሆነ\b', 'IF'),
+    (r'ካልሆነ\b', 'ELSEIF'),
+    (r'ያለዚያ\b', 'ELSE'),
+    (r'እስከሆነ\b', 'WHILE'),
+    (r'ድገም\b', 'FOR'),
+    (r'ከ\b', 'FROM'),
+    (r'እስከ\b', 'TO'),
+    (r'ተግባር\b', 'FUNCTION'),
+    (r'መልስ\b', 'RETURN'),
+    (r'ክፍል\b', 'CLASS'),
+    (r'አዲስ\b', 'NEW'),
+    (r'አውጣ\b', 'PRINT'),
+    (r'አስገባ\b', 'INPUT'),
+    (r'እውነት\b', 'TRUE'),
+    (r'ሐሰት\b', 'FALSE'),
+    (r'\d+(?:\.\d+)?', 'NUMBER'),
+    (r'(?:"[^"\n]*"|\'[^\'\n]*\')', 'STRING'),
+    # ግልጽ የፊደል ክፍል — \w የዩኒኮድ ምድብ ፍለጋ በየፊደሉ አይሰራም፤
+    # ሀ-ፚ ሙሉውን የግእዝ ፊደል ይሸፍናል
+    (r'[A-Za-z_ሀ-ፚ][A-Za-z0-9_ሀ-ፚ]*', 'IDENTIFIER'),
+]
+
+# ሁሉም ቅጦች በአንድ ትልቅ ንድፍ ይታመቃሉ — በየቶከኑ ~30 የተለያዩ ሙከራዎች
+# ፈንታ አንድ ማዛመድ ብቻ ይሰራል፤ አይነቱ በ match.lastgroup ይታወቃል።
+# DOTALL የሚያስፈልገው ለ COMMENT ብቻ ነው፤ ሌላ ቅጥ ባዶ '.' ስለሌለው
+# ንድፉ በሙሉ በ DOTALL ይታመቃል።
+MASTER_REGEX = re.compile(
+    "|".join(f"(?P<{type_}>{pattern})" for pattern, type_ in TOKEN_REGEX),
+    re.DOTALL)
+
+SINGLE_CHAR_TOKENS = {
+    '(': 'LPAREN',
+    ')': 'RPAREN',
+    '{': 'LBRACE',
+    '}': 'RBRACE',
+    '[': 'LBRACKET',
+    ']': 'RBRACKET',
+    ',': 'COMMA',
+    ';': 'SEMICOLON',
+    '.': 'DOT',
+    ':': 'COLON',
+    '!': 'NOT',
+}
+
+# ሥርዓተ ነጥቦች በቀጥታ የ dict ፍለጋ ይታወቃሉ — ለእያንዳንዱ '+', ';', '('
+# ወዘተ የ regex ሞተሩን መጥራት አያስፈልግም። ባለ ሁለት ፊደል ኦፕሬተሮች
+# ('==', '>=', ...) መጀመሪያ ይፈተሻሉ፤ አለዚያ '==' እንደ ሁለት '=' ይቆጠር ነበር።
+_FAST_DOUBLE = {
+    '==': 'EQ',
+    '!=': 'NEQ',
+    '>=': 'GTE',
+    '<=': 'LTE',
+    '&&': 'AND',
+    '||': 'OR',
+}
+
+_FAST_SINGLE = {
+    '+': 'PLUS',
+    '-': 'MINUS',
+    '*': 'MULT',
+    '/': 'DIV',
+    '=': 'EQUAL',
+    '<': 'LT',
+    '>': 'GT',
+    **SINGLE_CHAR_TOKENS,
+}
+
+# የአይነት ጽሁፎች አንድ ጊዜ intern ይደረጋሉ — ፓርሰሩ አይነቶችን በ == ሲያወዳድር
+# የመጀመሪያው ፍተሻ የጠቋሚ ንጽጽር ይሆናል
+TOKEN_REGEX = [(pattern, sys.intern(type_)) for pattern, type_ in TOKEN_REGEX]
+for _table in (_FAST_DOUBLE, _FAST_SINGLE, SINGLE_CHAR_TOKENS):
+    for _key in _table:
+        _table[_key] = sys.intern(_table[_key])
+
+
+def tokenize(code, filename=None):
+    """ምንጩን ወደ (አይነት, እሴት, መስመር, አምድ) ጥንዶች ይከፋፍላል።"""
+    code = normalize_code(code)
+    tokens = []
+    i = 0
+    line = 1
+    col = 1
+    while i < len(code):
+        ch = code[i]
+        if ch.isspace():
+            if ch == '\n':
+                line += 1
+                col = 1
+            else:
+                col += 1
+            i += 1
+            continue
+        pair = code[i:i + 2]
+        if pair in _FAST_DOUBLE:
+            tokens.append((_FAST_DOUBLE[pair], pair, line, col))
+            i += 2
+            col += 2
+            continue
+        if ch in _FAST_SINGLE:
+            tokens.append((_FAST_SINGLE[ch], ch, line, col))
+            i += 1
+            col += 1
+            continue
+        # MASTER_REGEX.match(code, i) ከ pos ጀምሮ ይመሳሰላል — የቀሪውን
+        # ምንጭ ቅጂ (code[i:]) በየደረጃው መስራት አያስፈልግም
+        match = MASTER_REGEX.match(code, i)
+        if match:
+            # lastgroup የራሱን የቡድን-ስም ቅጂ ይመልሳል — intern ወደ
+            # የጋራው ነገር ያዋህደዋል
+            type_ = sys.intern(match.lastgroup)
+            value = match.group(0)
+            start_col = col
+            if type_ != 'COMMENT':
+                tokens.append((type_, value, line, start_col))
+            if '\n' in value:
+                line += value.count('\n')
+                col = len(value) - value.rfind('\n')
+            else:
+                col += len(value)
+            i += len(value)
+            continue
+        raise LexerError(f"ያልታወቀ ምልክት -> '{ch}'", line=line, col=col,
+                         filename=filename)
+    return tokens
@@ -0,0 +1,171 @@
+class Number:
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return f"Number({self.value!r})"
+
+
+class String:
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return f"String({self.value!r})"
+
+
+class Boolean:
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return f"Boolean({self.value!r})"
+
+
+class ListNode:
+    def __init__(self, elements):
+        self.elements = elements
+
+    def __repr__(self):
+        return f"ListNode({self.elements!r})"
+
+
+class Variable:
+    __slots__ = ('name', '_cache_version', '_cache_value')
+
+    def __init__(self, name):
+        self.name = name
+        # የአስተርጓሚው inline cache — evaluator._eval_variable ይሞላቸዋል
+        self._cache_version = -2
+        self._cache_value = None
+
+    def __repr__(self):
+        return f"Variable({self.name!r})"
+
+
+class BinOp:
+    __slots__ = ('left', 'op', 'right', '_code')
+
+    def __init__(self, left, op, right):
+        self.left = left
+        self.op = op
+        self.right = right
+        # የታመቀ ፖስትፊክስ ኮድ — evaluator በመጀመሪያ ግምገማ ይሞላዋል፤
+        # False ማለት መታመቅ አይቻልም ማለት ነው
+        self._code = None
+
+    def __repr__(self):
+        return f"BinOp({self.left!r}, {self.op!r}, {self.right!r})"
+
+
+class Assign:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+
+class ListAssign:
+    def __init__(self, name, index, value):
+        self.name = name
+        self.index = index
+        self.value = value
+
+
+class ListAccessPos:
+    def __init__(self, name, index):
+        self.name = name
+        self.index = index
+
+
+class Print:
+    def __init__(self, value):
+        self.value = value
+
+
+class Input:
+    def __init__(self, prompt):
+        self.prompt = prompt
+
+
+class IfStatement:
+    def __init__(self, branches, else_body):
+        # branches: [(condition, body), ...] — የመጀመሪያው ከሆነ፣ ቀሪዎቹ ካልሆነ
+        self.branches = branches
+        self.else_body = else_body
+
+
+class WhileLoop:
+    def __init__(self, condition, body):
+        self.condition = condition
+        self.body = body
+        # የ (handler, stmt) ጥንዶች መሸጎጫ — executor በመጀመሪያ ፍጻሜ ይሞላዋል
+        self._cached_body = None
+
+
+class ForLoop:
+    def __init__(self, var, start, end, body):
+        self.var = var
+        self.start = start
+        self.end = end
+        self.body = body
+        # የ (handler, stmt) ጥንዶች መሸጎጫ — executor በመጀመሪያ ፍጻሜ ይሞላዋል
+        self._cached_body = None
+
+
+class Functions:
+    def __init__(self, name, params, body):
+        self.name = name
+        self.params = tuple(params)
+        self.body = body
+        # የመከራከሪያ ብዛቱ በጥሪ ጊዜ እንዳይቆጠር እዚህ ይቀመጣል
+        self._arity = len(self.params)
+        # jit.try_compile ሲሳካ CompiledFunction ይይዛል
+        self._compiled = None
+        # የ (handler, stmt) ጥንዶች መሸጎጫ — በመጀመሪያ ጥሪ ይሞላዋል
+        self._cached_body = None
+
+
+class FunctionCall:
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+
+class Return:
+    def __init__(self, value):
+        self.value = value
+
+
+class Class:
+    def __init__(self, name, body):
+        self.name = name
+        self.body = body
+        # የአባል ተግባራት ኢንዴክስ — ፍለጋው O(1) እንዲሆን በግንባታ ጊዜ ይሞላል
+        self.methods = {
+            statement.name: statement for statement in body
+            if isinstance(statement, Functions)
+        }
+
+
+class ClassCall:
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+
+class ModuleAccess:
+    def __init__(self, module_name, name, args=None):
+        # args=None ማለት የእሴት መዳረሻ ነው (ጥሪ አይደለም)
+        self.module_name = module_name
+        self.name = name
+        self.args = args
+
+
+class ImportStatement:
+    def __init__(self, path, alias=None):
+        self.path = path
+        self.alias = alias
@@ -0,0 +1,31 @@
+from src.error import ParseError, Reporter
+from src.parser.base import ParserBase
+from src.parser.expressions import ExpressionParser
+from src.parser.imports import ImportParser
+from src.parser.loops import LoopParser
+from src.parser.statements import StatementParser
+
+
+class Parser(ImportParser, LoopParser, StatementParser, ExpressionParser,
+             ParserBase):
+    """ቶከኖችን ወደ AST የሚቀይር ሙሉ ፓርሰር።"""
+
+    def parse(self):
+        statements = []
+        reporter = Reporter()
+        while not self.at_end():
+            try:
+                statements.append(self.parse_statement())
+            except ParseError as err:
+                reporter.add(err)
+                self.synchronize()
+        reporter.raise_if_any()
+        return statements
+
+    def synchronize(self):
+        """ከስህተት በኋላ ወደሚቀጥለው መግለጫ መጀመሪያ ይዘላል።"""
+        while not self.at_end():
+            if self.current_type() == 'SEMICOLON':
+                self.eat('SEMICOLON')
+                return
+            self.pos += 1
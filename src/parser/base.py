@@ -0,0 +1,52 @@
+from src.error import unexpected_token
+
+
+class ParserBase:
+    """የቶከን ዝርዝርን የሚያካሂድ መሠረታዊ ፓርሰር።"""
+
+    def __init__(self, tokens, filename=None):
+        self.tokens = tokens
+        self.pos = 0
+        self.filename = filename
+
+    def current(self):
+        """የአሁኑን ቶከን (አይነት, እሴት) ጥንድ ይመልሳል።"""
+        # ሌክሰሩ ሁልጊዜ ባለ 4 አባል ጥንዶች ያወጣል — የ len() ፍተሻ አያስፈልግም
+        if self.pos < len(self.tokens):
+            tok = self.tokens[self.pos]
+            return tok[0], tok[1]
+        return (None, None)
+
+    def current_type(self):
+        """የአሁኑን ቶከን አይነት ብቻ ይመልሳል — ያለ ጥንድ ግንባታ።"""
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos][0]
+        return None
+
+    def peek(self, offset=1):
+        pos = self.pos + offset
+        if pos < len(self.tokens):
+            tok = self.tokens[pos]
+            return tok[0], tok[1]
+        return (None, None)
+
+    def eat(self, token_type):
+        """የተጠበቀውን ቶከን በልቶ ያልፋል፤ ካልተገኘ ስህተት ያነሳል።"""
+        tokens = self.tokens
+        pos = self.pos
+        if pos < len(tokens):
+            tok = tokens[pos]
+            if tok[0] == token_type:
+                self.pos = pos + 1
+                return tok
+        raise unexpected_token(self, expected=token_type)
+
+    def at_end(self):
+        return self.pos >= len(self.tokens)
+
+    def error_location(self):
+        """(መስመር, አምድ, ፋይል) ለአሁኑ ቶከን ይመልሳል።"""
+        if self.pos < len(self.tokens):
+            tok = self.tokens[self.pos]
+            return tok[2], tok[3], self.filename
+        return None, None, self.filename
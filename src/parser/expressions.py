@@ -0,0 +1,173 @@
+import functools
+
+from src.error import unexpected_token
+from src.nodes import (BinOp, Boolean, ClassCall, FunctionCall, Input,
+                       ListAccessPos, ListNode, ModuleAccess, Number, String,
+                       Variable)
+
+_OP_SYMBOLS = {
+    'PLUS': '+',
+    'MINUS': '-',
+    'MULT': '*',
+    'DIV': '/',
+    'GT': '>',
+    'LT': '<',
+    'GTE': '>=',
+    'LTE': '<=',
+    'EQ': '==',
+    'NEQ': '!=',
+    'AND': '&&',
+    'OR': '||',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_number(value):
+    """ትንንሽ ቁጥሮች የጋራ Number ቅንጣት ይጋራሉ።"""
+    return Number(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_string(value):
+    """ባለ አንድ ፊደል ጽሑፎች የጋራ String ቅንጣት ይጋራሉ።"""
+    return String(value)
+
+
+class ExpressionParser:
+    """አገላለጾችን በቅድሚያ ቅደም ተከተል ይተነትናል።"""
+
+    def parse_expression(self):
+        return self.parse_or()
+
+    def parse_or(self):
+        left = self.parse_and()
+        while self.current_type() == 'OR':
+            self.eat('OR')
+            left = BinOp(left, '||', self.parse_and())
+        return left
+
+    def parse_and(self):
+        left = self.parse_equality()
+        while self.current_type() == 'AND':
+            self.eat('AND')
+            left = BinOp(left, '&&', self.parse_equality())
+        return left
+
+    def parse_equality(self):
+        left = self.parse_comparison()
+        while self.current_type() in ('EQ', 'NEQ'):
+            ttype = self.current_type()
+            self.eat(ttype)
+            left = BinOp(left, _OP_SYMBOLS[ttype], self.parse_comparison())
+        return left
+
+    def parse_comparison(self):
+        left = self.parse_additive()
+        while self.current_type() in ('GT', 'LT', 'GTE', 'LTE'):
+            ttype = self.current_type()
+            self.eat(ttype)
+            left = BinOp(left, _OP_SYMBOLS[ttype], self.parse_additive())
+        return left
+
+    def parse_additive(self):
+        left = self.parse_term()
+        while self.current_type() in ('PLUS', 'MINUS'):
+            ttype = self.current_type()
+            self.eat(ttype)
+            left = BinOp(left, _OP_SYMBOLS[ttype], self.parse_term())
+        return left
+
+    def parse_term(self):
+        left = self.parse_factor()
+        while self.current_type() in ('MULT', 'DIV'):
+            ttype = self.current_type()
+            self.eat(ttype)
+            left = BinOp(left, _OP_SYMBOLS[ttype], self.parse_factor())
+        return left
+
+    def parse_factor(self):
+        ttype, value = self.current()
+        if ttype == 'NUMBER':
+            self.eat('NUMBER')
+            if '.' in value:
+                return Number(float(value))
+            number = int(value)
+            if 0 <= number <= 256:
+                return _cached_number(number)
+            return Number(number)
+        if ttype == 'STRING':
+            self.eat('STRING')
+            text = value[1:-1]
+            if len(text) <= 1:
+                return _cached_string(text)
+            return String(text)
+        if ttype == 'TRUE':
+            self.eat('TRUE')
+            return Boolean(True)
+        if ttype == 'FALSE':
+            self.eat('FALSE')
+            return Boolean(False)
+        if ttype == 'MINUS':
+            self.eat('MINUS')
+            return BinOp(_cached_number(0), '-', self.parse_factor())
+        if ttype == 'INPUT':
+            self.eat('INPUT')
+            self.eat('LPAREN')
+            prompt = self.parse_expression()
+            self.eat('RPAREN')
+            return Input(prompt)
+        if ttype == 'NEW':
+            self.eat('NEW')
+            name = self.eat('IDENTIFIER')[1]
+            self.eat('LPAREN')
+            args = self.parse_arguments()
+            self.eat('RPAREN')
+            return ClassCall(name, args)
+        if ttype == 'LPAREN':
+            self.eat('LPAREN')
+            expr = self.parse_expression()
+            self.eat('RPAREN')
+            return expr
+        if ttype == 'LBRACKET':
+            self.eat('LBRACKET')
+            elements = []
+            if self.current_type() != 'RBRACKET':
+                elements.append(self.parse_expression())
+                while self.current_type() == 'COMMA':
+                    self.eat('COMMA')
+                    elements.append(self.parse_expression())
+            self.eat('RBRACKET')
+            return ListNode(elements)
+        if ttype == 'IDENTIFIER':
+            self.eat('IDENTIFIER')
+            name = value
+            if self.current_type() == 'LPAREN':
+                self.eat('LPAREN')
+                args = self.parse_arguments()
+                self.eat('RPAREN')
+                return FunctionCall(name, args)
+            if self.current_type() == 'DOT':
+                self.eat('DOT')
+                member = self.eat('IDENTIFIER')[1]
+                if self.current_type() == 'LPAREN':
+                    self.eat('LPAREN')
+                    args = self.parse_arguments()
+                    self.eat('RPAREN')
+                    return ModuleAccess(name, member, args)
+                return ModuleAccess(name, member)
+            if self.current_type() == 'LBRACKET':
+                self.eat('LBRACKET')
+                index = self.parse_expression()
+                self.eat('RBRACKET')
+                return ListAccessPos(name, index)
+            return Variable(name)
+        raise unexpected_token(self)
+
+    def parse_arguments(self):
+        args = []
+        if self.current_type() != 'RPAREN':
+            args.append(self.parse_expression())
+            while self.current_type() == 'COMMA':
+                self.eat('COMMA')
+                args.append(self.parse_expression())
+        return args
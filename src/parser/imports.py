@@ -0,0 +1,15 @@
+from src.nodes import ImportStatement
+
+
+class ImportParser:
+    """የአስመጣ መግለጫዎችን ይተነትናል።"""
+
+    def parse_import(self):
+        self.eat('IMPORT')
+        path = self.eat('STRING')[1][1:-1]
+        alias = None
+        if self.current_type() == 'AS':
+            self.eat('AS')
+            alias = self.eat('IDENTIFIER')[1]
+        self.eat('SEMICOLON')
+        return ImportStatement(path, alias)
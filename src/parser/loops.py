@@ -0,0 +1,23 @@
+from src.nodes import ForLoop, WhileLoop
+
+
+class LoopParser:
+    """የዑደት መግለጫዎችን ይተነትናል።"""
+
+    def parse_while(self):
+        self.eat('WHILE')
+        self.eat('LPAREN')
+        condition = self.parse_expression()
+        self.eat('RPAREN')
+        body = self.parse_block()
+        return WhileLoop(condition, body)
+
+    def parse_for(self):
+        self.eat('FOR')
+        var = self.eat('IDENTIFIER')[1]
+        self.eat('FROM')
+        start = self.parse_expression()
+        self.eat('TO')
+        end = self.parse_expression()
+        body = self.parse_block()
+        return ForLoop(var, start, end, body)
@@ -0,0 +1,105 @@
+from src.nodes import (Assign, Class, Functions, IfStatement, ListAccessPos,
+                       ListAssign, Print, Return, Variable)
+
+
+class StatementParser:
+    """መግለጫዎችን ይተነትናል።"""
+
+    def parse_statement(self):
+        ttype = self.current_type()
+        if ttype == 'IMPORT':
+            return self.parse_import()
+        if ttype == 'PRINT':
+            return self.parse_print()
+        if ttype == 'IF':
+            return self.parse_if()
+        if ttype == 'WHILE':
+            return self.parse_while()
+        if ttype == 'FOR':
+            return self.parse_for()
+        if ttype == 'FUNCTION':
+            return self.parse_function()
+        if ttype == 'CLASS':
+            return self.parse_class()
+        if ttype == 'RETURN':
+            return self.parse_return()
+        return self.parse_assign_or_expression()
+
+    def parse_block(self):
+        self.eat('LBRACE')
+        body = []
+        while self.current_type() not in ('RBRACE', None):
+            body.append(self.parse_statement())
+        self.eat('RBRACE')
+        return body
+
+    def parse_print(self):
+        self.eat('PRINT')
+        self.eat('LPAREN')
+        value = self.parse_expression()
+        self.eat('RPAREN')
+        self.eat('SEMICOLON')
+        return Print(value)
+
+    def parse_if(self):
+        self.eat('IF')
+        self.eat('LPAREN')
+        condition = self.parse_expression()
+        self.eat('RPAREN')
+        branches = [(condition, self.parse_block())]
+        while self.current_type() == 'ELSEIF':
+            self.eat('ELSEIF')
+            self.eat('LPAREN')
+            condition = self.parse_expression()
+            self.eat('RPAREN')
+            branches.append((condition, self.parse_block()))
+        else_body = None
+        if self.current_type() == 'ELSE':
+            self.eat('ELSE')
+            else_body = self.parse_block()
+        return IfStatement(branches, else_body)
+
+    def parse_function(self):
+        self.eat('FUNCTION')
+        name = self.eat('IDENTIFIER')[1]
+        self.eat('LPAREN')
+        params = []
+        if self.current_type() == 'IDENTIFIER':
+            params.append(self.eat('IDENTIFIER')[1])
+            while self.current_type() == 'COMMA':
+                self.eat('COMMA')
+                params.append(self.eat('IDENTIFIER')[1])
+        self.eat('RPAREN')
+        body = self.parse_block()
+        return Functions(name, params, body)
+
+    def parse_class(self):
+        self.eat('CLASS')
+        name = self.eat('IDENTIFIER')[1]
+        self.eat('LBRACE')
+        body = []
+        while self.current_type() not in ('RBRACE', None):
+            body.append(self.parse_statement())
+        self.eat('RBRACE')
+        return Class(name, body)
+
+    def parse_return(self):
+        self.eat('RETURN')
+        value = self.parse_expression()
+        self.eat('SEMICOLON')
+        return Return(value)
+
+    def parse_assign_or_expression(self):
+        expr = self.parse_expression()
+        if isinstance(expr, Variable) and self.current_type() == 'EQUAL':
+            self.eat('EQUAL')
+            value = self.parse_expression()
+            self.eat('SEMICOLON')
+            return Assign(expr.name, value)
+        if isinstance(expr, ListAccessPos) and self.current_type() == 'EQUAL':
+            self.eat('EQUAL')
+            value = self.parse_expression()
+            self.eat('SEMICOLON')
+            return ListAssign(expr.name, expr.index, value)
+        self.eat('SEMICOLON')
+        return expr
@@ -0,0 +1,70 @@
+import math
+import random
+
+from src.error import InterpreterError
+
+
+class BuiltinFunction:
+    """በፓይተን የተሰራ ተግባር መጠቅለያ።"""
+
+    def __init__(self, fn, arity, safe=False):
+        self.fn = fn
+        self.arity = arity
+        # safe=True ማለት ገምጋሚው የ call መጠቅለያውን ዘሎ fn-ን በቀጥታ
+        # መጥራት ይችላል፤ ስህተት ከተነሳ ወደ call ተመልሶ InterpreterError ይሆናል
+        self.safe = safe
+
+    def call(self, args):
+        if self.arity is not None and len(args) != self.arity:
+            raise InterpreterError(
+                f"የመከራከሪያ ብዛት ስህተት: የተጠበቀው {self.arity}፣ "
+                f"የተገኘው {len(args)}")
+        try:
+            return self.fn(*args)
+        except InterpreterError:
+            raise
+        except Exception as e:
+            raise InterpreterError(f"የውስጥ ተግባር ስህተት: {e}")
+
+
+def b_get(url, mode):
+    # requests ከነጥገኞቹ (urllib3, ssl, ...) ከባድ ነው — መረብ የማይጠቀሙ
+    # ፕሮግራሞች የመነሻ ጊዜውን እንዳይከፍሉ እዚህ በመጀመሪያ ጥሪ ይጫናል
+    import requests
+    resp = requests.get(url)
+    if mode == "json":
+        return resp.json()
+    return resp.text
+
+
+# የ C ተግባራት (len, math.sqrt, ...) በቀጥታ ይታሰራሉ — ተጨማሪ የፓይተን
+# መጠቅለያ frame በየጥሪው መክፈል አያስፈልግም
+builtins = {
+    "ርዝመት": BuiltinFunction(len, 1, safe=True),
+    "ቁጥር": BuiltinFunction(int, 1, safe=True),
+    "ነጥብ": BuiltinFunction(float, 1, safe=True),
+    "ጽሑፍ": BuiltinFunction(str, 1, safe=True),
+    "ሂሳብ": {
+        "abs": BuiltinFunction(abs, 1, safe=True),
+        "sqrt": BuiltinFunction(math.sqrt, 1, safe=True),
+        "sin": BuiltinFunction(math.sin, 1, safe=True),
+        "cos": BuiltinFunction(math.cos, 1, safe=True),
+        "tan": BuiltinFunction(math.tan, 1, safe=True),
+        "asin": BuiltinFunction(math.asin, 1, safe=True),
+        "acos": BuiltinFunction(math.acos, 1, safe=True),
+        "atan": BuiltinFunction(math.atan, 1, safe=True),
+        "pow": BuiltinFunction(math.pow, 2, safe=True),
+        "round": BuiltinFunction(round, 1, safe=True),
+        "max": BuiltinFunction(max, None, safe=True),
+        "min": BuiltinFunction(min, None, safe=True),
+        "pi": math.pi,
+        "e": math.e,
+    },
+    "እድል": {
+        "random": BuiltinFunction(random.random, 0, safe=True),
+        "randint": BuiltinFunction(random.randint, 2, safe=True),
+    },
+    "መረብ": {
+        "get": BuiltinFunction(b_get, 2),
+    },
+}
@@ -0,0 +1,17 @@
+class Environment:
+    """የአስተርጓሚው ሁኔታ — ተለዋዋጮች፣ ተግባራት፣ ሞጁሎች እና ክፍሎች።"""
+
+    def __init__(self):
+        self.memory = {}
+        self.functions = {}
+        self.modules = {}
+        self.classes = {}
+        # ከሞጁሎች የመጡ ተግባራት ጠፍጣፋ ኢንዴክስ — በየጥሪው ሁሉንም
+        # ሞጁሎች መቃኘት እንዳያስፈልግ በአስመጣ ጊዜ ይሞላል
+        self.global_funcs = {}
+        # በእያንዳንዱ የማህደረ ትውስታ ለውጥ ላይ ይጨመራል፤ የ Variable
+        # inline cache ትክክለኛነትን ለመፈተሽ ያገለግላል
+        self.memory_version = 0
+
+
+env = Environment()